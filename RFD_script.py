@@ -9,12 +9,18 @@ This script automates the creation of renewable fuel declarations by:
 4. Saving the generated PDFs to a specified output folder
 
 Required Libraries:
-- pandas: For data manipulation (though not heavily used in this script)
+- pandas: For preparing the qualifying customer data as one table
+- openpyxl: For fast read-only access to the source Excel file (and for filling the
+  template when LibreOffice is used instead of Excel)
 - xlwings: For Excel file operations and PDF export
-- os: For file system operations
+- pywin32 (pythoncom): Installed with xlwings, used to set up Excel in each worker process
+- os / pathlib: For file system operations and building file paths
+- re: For cleaning up text used in file names
 - calendar: For date/month processing
-- shutil: For file copying operations
 - datetime: For current date handling
+- concurrent.futures / atexit: For running several Excel workers in parallel
+- io / contextlib / sys: For collecting each row's progress messages and printing them in one go
+- subprocess / tempfile: For the optional LibreOffice PDF conversion
 
 Author: James Cake
 Date: 18/07/25
@@ -22,25 +28,40 @@ Date: 18/07/25
 
 import pandas as pd
 import xlwings as xw
+from openpyxl import load_workbook
 import os
+import re
+import io
+import sys
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
 import calendar
-import shutil
+import atexit
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+# Month abbreviation to month number lookup (Jan=1, Feb=2, etc.), built once
+_MONTH_IDX = {m: i for i, m in enumerate(calendar.month_abbr) if m}
+
+# Anything that is not a letter, number, space, hyphen or underscore is unsafe in a file name
+_UNSAFE = re.compile(r'[^\w \-]+')
+
 # =====================================================================================
 # SECTION 1: DATA EXTRACTION FUNCTIONS
 # =====================================================================================
 
-def extract_row_data(source_file, row_number):
+def extract_row_data(data_row):
     """
-    Extract customer data from a specific row in the Excel source file.
+    Extract customer data from a single row of the Excel source file.
     
-    This function opens the Excel file, navigates to the 'RFAS GHG Saving Calculation' 
-    worksheet, and extracts data from specific columns for the given row number.
+    The 'RFAS GHG Saving Calculation' worksheet is streamed row by row with
+    openpyxl by the main processing function. This function just picks the
+    values it needs out of one of those rows, so it does not talk to Excel at all.
     
     Parameters:
-    - source_file (str): Full path to the Excel file containing customer data
-    - row_number (int): The row number to extract data from (starting from row 2)
+    - data_row (tuple): The values of one source row, columns A to W in order
     
     Returns:
     - dict: A dictionary containing all the customer data needed for the declaration
@@ -62,227 +83,679 @@ def extract_row_data(source_file, row_number):
     - V: Traceability from Origin
     - W: SC Voluntary Sustain Scheme
     """
-    print(f"    Extracting data from row {row_number}...")
-    
-    # Open Excel application invisibly (won't show on screen)
-    with xw.App(visible=False) as app:
-        # Open the source workbook
-        wb = xw.Book(source_file)
-        # Select the specific worksheet containing the data
-        ws = wb.sheets['RFAS GHG Saving Calculation']
-        
-        # Extract data from specific cells in the row
-        # Each key in this dictionary corresponds to a field in the declaration template
-        row_data = {
-            'customer_name': ws[f'B{row_number}'].value,           # Column B: Customer Name
-            'customer_address': ws[f'N{row_number}'].value,       # Column N: Customer Address
-            'volume_of_fuel_supplied': ws[f'D{row_number}'].value,  # Column D: Volume (kg)
-            'renewable_percentage': ws[f'F{row_number}'].value,     # Column F: Renewable %
-            'ghg_emissions_intensity': ws[f'I{row_number}'].value,  # Column I: GHG Emissions
-            'declaration_number': ws[f'M{row_number}'].value,      # Column M: Declaration Number
-            'certificate_number': ws[f'K{row_number}'].value,      # Column K: Certificate Number
-            'declaration_period': ws[f'O{row_number}'].value,      # Column O: Declaration Period
-            'date_dec_issued': datetime.now().strftime('%d/%m/%Y'), # Current date in UK format
-            'production_process': ws[f'Q{row_number}'].value,      # Column Q: Production Process
-            'country_of_production': ws[f'R{row_number}'].value,   # Column R: Country of Production
-            'distribution_of_fuel': ws[f'S{row_number}'].value,    # Column S: Distribution Method
-            'feedstock': ws[f'T{row_number}'].value,               # Column T: Feedstock Type
-            'country_of_origin': ws[f'U{row_number}'].value,       # Column U: Country of Origin
-            'traceability_from_origin': ws[f'V{row_number}'].value, # Column V: Traceability
-            'sc_voluntary_sustain_scheme': ws[f'W{row_number}'].value # Column W: Sustainability Scheme
-        }
-        
-        # Close the workbook to free up memory
-        wb.close()
-        return row_data
+    # Extract data from specific columns in the row (A=0, B=1, C=2, ...)
+    # Each key in this dictionary corresponds to a field in the declaration template
+    row_data = {
+        'customer_name': data_row[1],                # Column B: Customer Name
+        'customer_address': data_row[13],            # Column N: Customer Address
+        'volume_of_fuel_supplied': data_row[3],      # Column D: Volume (kg)
+        'renewable_percentage': data_row[5],         # Column F: Renewable %
+        'ghg_emissions_intensity': data_row[8],      # Column I: GHG Emissions
+        'declaration_number': data_row[12],          # Column M: Declaration Number
+        'certificate_number': data_row[10],          # Column K: Certificate Number
+        'declaration_period': data_row[14],          # Column O: Declaration Period
+        'production_process': data_row[16],          # Column Q: Production Process
+        'country_of_production': data_row[17],       # Column R: Country of Production
+        'distribution_of_fuel': data_row[18],        # Column S: Distribution Method
+        'feedstock': data_row[19],                   # Column T: Feedstock Type
+        'country_of_origin': data_row[20],           # Column U: Country of Origin
+        'traceability_from_origin': data_row[21],    # Column V: Traceability
+        'sc_voluntary_sustain_scheme': data_row[22]  # Column W: Sustainability Scheme
+    }
+    
+    return row_data
 
 # =====================================================================================
 # SECTION 2: DATA PROCESSING FUNCTIONS
 # =====================================================================================
 
+def count_declaration_months(declaration_period):
+    """
+    Count how many months a declaration period covers.
+    
+    Parameters:
+    - declaration_period (str): Period string like "Jan to Mar 2025"
+    
+    Returns:
+    - int: Number of months in the period (inclusive), e.g. 3 for "Jan to Mar 2025"
+    
+    Raises:
+    - AttributeError, IndexError or KeyError if the period is not in the expected format
+    """
+    # Split the period string by " to " to get start and end months
+    parts = declaration_period.split(" to ")
+    start_month = parts[0].strip()  # e.g., "Jan"
+    end_month = parts[1].split()[0].strip()  # e.g., "Mar" (removes year)
+    
+    # Convert month abbreviations to numbers (Jan=1, Feb=2, etc.)
+    start_month_num = _MONTH_IDX[start_month]
+    end_month_num = _MONTH_IDX[end_month]
+    
+    # Calculate number of months (inclusive)
+    return end_month_num - start_month_num + 1
+
+def is_valid_declaration_period(declaration_period):
+    """
+    Check whether a declaration period can be parsed by count_declaration_months.
+    
+    Parameters:
+    - declaration_period: The value from the source file
+    
+    Returns:
+    - bool: True if the period is in the expected "Jan to Mar 2025" format
+    """
+    try:
+        count_declaration_months(declaration_period)
+        return True
+    except (AttributeError, IndexError, KeyError):
+        return False
+
 def process_declaration_period(declaration_period):
     """
     Process the declaration period string to add month count information.
     
     This function takes a declaration period like "Jan to Mar 2025" and converts it
     to "3 months - Jan to Mar 2025" for better clarity in the declaration.
+    Periods are checked up front by validate_customers, so the period is
+    expected to be in the right format here.
     
     Parameters:
     - declaration_period (str): Period string like "Jan to Mar 2025"
     
     Returns:
-    - str: Enhanced period string with month count, or original if parsing fails
+    - str: Enhanced period string with month count
     """
-    try:
-        # Split the period string by " to " to get start and end months
-        parts = declaration_period.split(" to ")
-        start_month = parts[0].strip()  # e.g., "Jan"
-        end_month = parts[1].split()[0].strip()  # e.g., "Mar" (removes year)
-        
-        # Convert month abbreviations to numbers (Jan=1, Feb=2, etc.)
-        start_month_num = list(calendar.month_abbr).index(start_month)
-        end_month_num = list(calendar.month_abbr).index(end_month)
-        
-        # Calculate number of months (inclusive)
-        num_months = end_month_num - start_month_num + 1
-        
-        # Return enhanced string with month count
-        return f"{num_months} months - {declaration_period}"
-    except (IndexError, ValueError) as e:
-        # If parsing fails, print error and return original string
-        print(f"Error parsing declaration period '{declaration_period}': {e}")
-        return declaration_period
+    num_months = count_declaration_months(declaration_period)
+    
+    # Return enhanced string with month count
+    return f"{num_months} months - {declaration_period}"
 
-def sanitize_filename(s):
+def validate_customers(customers):
     """
-    Clean a string to make it safe for use in file names.
+    Check every qualifying customer's data before any files are created.
+    
+    Rows with a missing customer name, a volume that is not a number or a
+    declaration period that can't be read would otherwise only fail part way
+    through creating their declaration. Checking them all up front means no
+    time is wasted on them in Excel.
+    
+    Parameters:
+    - customers (pd.DataFrame): Customer data, one row per customer, indexed by Excel row number
+    
+    Returns:
+    - tuple: (DataFrame of rows that passed, list of (row number, problem) pairs for rows that didn't)
+    """
+    names = customers['customer_name']
+    checks = [
+        (names.notna() & (names.astype(str).str.strip().str.len() > 0),
+         "No customer name found"),
+        (customers['volume_of_fuel_supplied'].apply(lambda v: isinstance(v, (int, float)) and not isinstance(v, bool)),
+         "Volume of fuel supplied is not a number"),
+        (customers['declaration_period'].apply(is_valid_declaration_period),
+         "Declaration period is not in the 'Jan to Mar 2025' format"),
+    ]
+    
+    invalid_rows = []
+    is_valid = pd.Series(True, index=customers.index)
+    for passed, problem in checks:
+        # Only report the first problem found for each row
+        for row_num in customers.index[~passed & is_valid]:
+            invalid_rows.append((row_num, f"{problem}: skipped before processing"))
+        is_valid &= passed
+    
+    invalid_rows.sort()
+    return customers[is_valid].copy(), invalid_rows
+
+def sanitize_filenames(values):
+    """
+    Clean a whole column of strings to make them safe for use in file names.
     
     This function removes special characters that could cause issues in file names,
-    keeping only alphanumeric characters, spaces, hyphens, and underscores.
+    keeping only alphanumeric characters, spaces, hyphens, and underscores. The
+    whole column is cleaned in one go by pandas rather than one value at a time.
+    
+    Parameters:
+    - values (pd.Series): The values to sanitize (non-text values are converted to text)
+    
+    Returns:
+    - pd.Series: The cleaned strings, safe for file names
+    """
+    # Remove every run of unsafe characters, then any trailing spaces
+    # map(str) converts every value exactly like str() would, so blanks become 'None'
+    return values.map(str).str.replace(_UNSAFE, '', regex=True).str.rstrip()
+
+def group_cell_updates(update_data):
+    """
+    Group single-cell updates into blocks of vertically adjacent cells.
+    
+    Every write to Excel is a separate call between Python and Excel, so writing
+    a block such as D12:D13 in one go is much quicker than writing D12 and D13
+    separately. Cells that have no neighbour directly above or below them are
+    left as single-cell writes.
     
     Parameters:
-    - s (str): The string to sanitize
+    - update_data (list): List of (cell_address, value) pairs, e.g. ('D12', 0.5)
     
     Returns:
-    - str: A cleaned string safe for file names
+    - list: List of (range_address, value) pairs, where blocks of more than one
+      cell use an address like 'D12:D13' and a list of rows, e.g. [[0.5], ['10 kg']]
     """
-    # Keep only alphanumeric characters and safe punctuation
-    return "".join(c for c in str(s) if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    # Split each address into its column letters and row number, e.g. 'D12' -> ('D', 12)
+    cells = []
+    for cell_address, value in update_data:
+        column = cell_address.rstrip('0123456789')
+        row = int(cell_address[len(column):])
+        cells.append((column, row, value))
+    
+    # Sort by column then row so adjacent cells end up next to each other
+    cells.sort(key=lambda cell: (cell[0], cell[1]))
+    
+    blocks = []
+    for column, row, value in cells:
+        previous = blocks[-1] if blocks else None
+        if previous and previous[0] == column and previous[2] == row - 1:
+            # This cell sits directly below the previous block, so extend it
+            previous[2] = row
+            previous[3].append([value])
+        else:
+            blocks.append([column, row, row, [[value]]])
+    
+    grouped_updates = []
+    for column, first_row, last_row, values in blocks:
+        if first_row == last_row:
+            grouped_updates.append((f"{column}{first_row}", values[0][0]))
+        else:
+            grouped_updates.append((f"{column}{first_row}:{column}{last_row}", values))
+    return grouped_updates
+
+def build_template_updates(row_data):
+    """
+    Work out which value goes into which cell of the declaration template.
+    
+    Parameters:
+    - row_data (dict): Customer data for one row (see create_declaration_for_row)
+    
+    Returns:
+    - list: List of (cell_address, value) pairs to write into the template
+    """
+    # Process the declaration period to include month count
+    total_dec_period = process_declaration_period(row_data['declaration_period'])
+    
+    # UPDATE THESE CELL REFERENCES IF YOUR TEMPLATE CHANGES
+    return [
+        ('D5', row_data['customer_name']),          # Cell D5: Customer Name
+        ('Q5', row_data['customer_address']),       # Cell Q5: Customer Address
+        ('D8', row_data['declaration_number']),     # Cell D8: Declaration Number
+        ('Q7', total_dec_period),                   # Cell Q7: Declaration Period (with month count)
+        ('Q8', row_data['date_dec_issued']),        # Cell Q8: Date Declaration Issued
+        ('D12', row_data['renewable_percentage']),  # Cell D12: Renewable Percentage
+        # float() so whole numbers read by openpyxl as int still show as e.g. "1234.0 kg"
+        ('D13', f"{round(float(row_data['volume_of_fuel_supplied']), 1)} kg"),  # Cell D13: Volume (rounded to 1 decimal)
+        ('U11', row_data['ghg_emissions_intensity']), # Cell U11: GHG Emissions Intensity
+        ('D15', row_data['production_process']),    # Cell D15: Production Process
+        ('D17', row_data['country_of_production']), # Cell D17: Country of Production
+        ('D19', row_data['distribution_of_fuel']),  # Cell D19: Distribution Method
+        ('D26', row_data['feedstock']),             # Cell D26: Feedstock Type
+        ('D29', row_data['country_of_origin']),     # Cell D29: Country of Origin
+        ('D32', row_data['traceability_from_origin']), # Cell D32: Traceability
+        ('D34', row_data['sc_voluntary_sustain_scheme']) # Cell D34: Sustainability Scheme
+    ]
+
+def build_output_paths(row_data, output_folder):
+    """
+    Build the PDF and Excel file paths for one customer's declaration.
+    
+    The safe file name fields (saveable_*) are created for all rows at once
+    in process_all_supply_blend_rows before any declarations are made.
+    
+    Parameters:
+    - row_data (dict): Customer data for one row (see create_declaration_for_row)
+    - output_folder (Path): Where to save the generated files
+    
+    Returns:
+    - tuple: (PDF file path, Excel file path) as Path objects
+    """
+    saveable_customer_name = row_data['saveable_customer_name']
+    saveable_certificate_number = row_data['saveable_certificate_number']
+    saveable_declaration_period = row_data['saveable_declaration_period']
+    
+    # Both files share the same name, only the extension differs
+    file_name = f"Renewable_Fuel_Declaration - {saveable_certificate_number} - {saveable_declaration_period} - {saveable_customer_name}"
+    
+    # Final PDF output file
+    pdf_output_file = output_folder / f"{file_name}.pdf"
+    
+    # Excel output file (if keeping Excel version)
+    excel_output_file = output_folder / f"{file_name}.xlsm"
+    
+    return pdf_output_file, excel_output_file
+
+def remove_duplicate_output_rows(rows_to_process, output_folder):
+    """
+    Drop rows whose declaration would have the same file name as an earlier row.
+    
+    Two such rows would overwrite each other's files (or, with several Excel
+    workers, try to write the same file at the same time), so only the first
+    of them is processed and the others are reported as errors.
+    
+    Parameters:
+    - rows_to_process (list): List of (row number, customer data) pairs
+    - output_folder (Path): Where the generated files will be saved
+    
+    Returns:
+    - tuple: (list of rows to process, list of (row number, problem) pairs for the dropped rows)
+    """
+    rows_by_output_file = {}
+    unique_rows = []
+    duplicate_rows = []
+    for row_num, row_data in rows_to_process:
+        pdf_output_file, _ = build_output_paths(row_data, output_folder)
+        # Windows file names ignore case, so 'ACME' and 'Acme' would be the same file
+        output_key = str(pdf_output_file).lower()
+        if output_key in rows_by_output_file:
+            problem = f"Same output file name as row {rows_by_output_file[output_key]} ({pdf_output_file.name}): skipped"
+            duplicate_rows.append((row_num, problem))
+        else:
+            rows_by_output_file[output_key] = row_num
+            unique_rows.append((row_num, row_data))
+    return unique_rows, duplicate_rows
 
 # =====================================================================================
 # SECTION 3: PDF GENERATION FUNCTIONS
 # =====================================================================================
 
-def create_declaration_for_row(source_file, template_file, row_number, output_folder, save_as_pdf=True, keep_excel=False, temp_files_list=None):
+def create_declaration_for_row(row_data, template_wb, row_number, output_folder, save_as_pdf=True, keep_excel=False):
     """
     Create a declaration document for a specific customer row.
     
     This is the main function that:
-    1. Extracts customer data from the specified row
-    2. Creates a copy of the template file
-    3. Fills in the template with customer data
-    4. Saves as PDF (and optionally Excel)
-    5. Cleans up temporary files
+    1. Fills in the open template with customer data
+    2. Saves as PDF (and optionally Excel)
+    
+    The template is opened once per worker process and filled in place for
+    every row - no temporary copy is written to disk - and every PDF is
+    exported from that same open workbook, so Excel's PDF set-up (fonts,
+    printer driver, page setup) is only done once per worker. Every row writes the
+    same set of cells, so each row simply overwrites the previous row's
+    values. The template is closed without saving at the end of the run, so
+    the template file itself is never changed.
     
     Parameters:
-    - source_file (str): Path to Excel file with customer data
-    - template_file (str): Path to declaration template file
+    - row_data (dict): Customer data for this row, as returned by extract_row_data,
+      plus the date_dec_issued and saveable_* file name fields added in
+      process_all_supply_blend_rows
+    - template_wb (xw.Book): The declaration template, opened once for the whole run
     - row_number (int): Row number to process
-    - output_folder (str): Where to save the generated files
+    - output_folder (Path): Where to save the generated files
     - save_as_pdf (bool): Whether to save as PDF (default: True)
     - keep_excel (bool): Whether to keep Excel version (default: False)
-    - temp_files_list (list): List to track temporary files for cleanup
     
     Returns:
-    - str: Path to the created file, or None if customer name is empty
+    - Path: Path to the created file
     """
     print(f"  Processing row {row_number}...")
     
-    # STEP 1: Extract customer data from the source file
-    row_data = extract_row_data(source_file, row_number)
-    
-    # STEP 2: Check if customer name exists (skip empty rows)
-    if not row_data['customer_name']:
-        print(f"    Row {row_number}: No customer name found, skipping this row")
-        return None
-    
-    # STEP 3: Process the declaration period to include month count
-    total_dec_period = process_declaration_period(row_data['declaration_period'])
-    
-    # STEP 4: Create safe filenames by removing special characters
-    saveable_customer_name = sanitize_filename(row_data['customer_name'])
-    saveable_certificate_number = sanitize_filename(row_data['certificate_number'])
-    saveable_declaration_period = sanitize_filename(row_data['declaration_period'])
-    
-    # STEP 5: Define file paths for temporary and final files
-    # Temporary Excel file (will be deleted after PDF creation)
-    temp_excel_file = os.path.join(output_folder, f"temp_{row_number}_Renewable_Fuel_Declaration - {saveable_customer_name}.xlsm")
-    
-    # Final PDF output file
-    pdf_output_file = os.path.join(output_folder, f"Renewable_Fuel_Declaration - {saveable_certificate_number} - {saveable_declaration_period} - {saveable_customer_name}.pdf")
+    # STEP 1: Customer data was already extracted during the scan of the source file
     
-    # Excel output file (if keeping Excel version)
-    excel_output_file = os.path.join(output_folder, f"Renewable_Fuel_Declaration - {saveable_certificate_number} - {saveable_declaration_period} - {saveable_customer_name}.xlsm")
+    # STEP 2: The data was checked by validate_customers, so no need to check it again here
     
-    # STEP 6: Create a copy of the template file
-    print(f"    Creating temporary file for {row_data['customer_name']}...")
-    shutil.copy2(template_file, temp_excel_file)
+    # STEP 3: Define file paths for the output files
+    pdf_output_file, excel_output_file = build_output_paths(row_data, output_folder)
     
     pdf_created_successfully = False
+    excel_created_successfully = False
+    error = None  # The most recent error, reported if no file could be created
     
     try:
-        # STEP 7: Open the temporary Excel file and fill in the data
+        # STEP 4: Fill in the open template directly (no temporary copy needed)
         print(f"    Filling template with data for {row_data['customer_name']}...")
-        with xw.App(visible=False) as app:
-            wb = xw.Book(temp_excel_file)
-            ws = wb.sheets.active  # Use the active (first) sheet
-            
-            # STEP 8: Fill in the template with customer data
-            # UPDATE THESE CELL REFERENCES IF YOUR TEMPLATE CHANGES
-            update_data = [
-                ('D5', row_data['customer_name']),          # Cell D5: Customer Name
-                ('Q5', row_data['customer_address']),       # Cell Q5: Customer Address
-                ('D8', row_data['declaration_number']),     # Cell D8: Declaration Number
-                ('Q7', total_dec_period),                   # Cell Q7: Declaration Period (with month count)
-                ('Q8', row_data['date_dec_issued']),        # Cell Q8: Date Declaration Issued
-                ('D12', row_data['renewable_percentage']),  # Cell D12: Renewable Percentage
-                ('D13', f"{round(row_data['volume_of_fuel_supplied'], 1)} kg"),  # Cell D13: Volume (rounded to 1 decimal)
-                ('U11', row_data['ghg_emissions_intensity']), # Cell U11: GHG Emissions Intensity
-                ('D15', row_data['production_process']),    # Cell D15: Production Process
-                ('D17', row_data['country_of_production']), # Cell D17: Country of Production
-                ('D19', row_data['distribution_of_fuel']),  # Cell D19: Distribution Method
-                ('D26', row_data['feedstock']),             # Cell D26: Feedstock Type
-                ('D29', row_data['country_of_origin']),     # Cell D29: Country of Origin
-                ('D32', row_data['traceability_from_origin']), # Cell D32: Traceability
-                ('D34', row_data['sc_voluntary_sustain_scheme']) # Cell D34: Sustainability Scheme
-            ]
-            
-            # STEP 9: Update all cells with the customer data
-            print(f"    Updating {len(update_data)} fields in template...")
-            for cell_address, value in update_data:
-                ws[cell_address].value = value
-            
-            # STEP 10: Save as PDF if requested
-            if save_as_pdf:
-                try:
-                    print(f"    Creating PDF for {row_data['customer_name']}...")
-                    # Export to PDF using Excel's built-in PDF export
-                    wb.api.ExportAsFixedFormat(0, pdf_output_file)  # 0 = xlTypePDF
-                    pdf_created_successfully = True
-                    print(f"    ✓ Successfully created PDF for '{row_data['customer_name']}'")
-                except Exception as e:
-                    print(f"    ✗ Error creating PDF for row {row_number}: {e}")
-                    pdf_created_successfully = False
-            
-            # STEP 11: Save as Excel if requested or if PDF creation failed
-            if keep_excel or (save_as_pdf and not pdf_created_successfully):
-                if keep_excel:
+        ws = template_wb.sheets.active  # Use the active (first) sheet
+        
+        # STEP 5: Work out which template cells get which customer data
+        update_data = build_template_updates(row_data)
+        
+        # STEP 6: Update all cells with the customer data
+        # Adjacent cells (e.g. D12:D13) are written together to cut down on calls to Excel
+        grouped_updates = group_cell_updates(update_data)
+        print(f"    Updating {len(update_data)} fields in template ({len(grouped_updates)} writes)...")
+        for range_address, value in grouped_updates:
+            ws.range(range_address).value = value
+        
+        # Calculation is set to manual for the shared app, so recalculate once now.
+        # This recalculates the whole workbook (other sheets may depend on these cells),
+        # and the template is the only workbook open in this worker's Excel.
+        template_wb.app.calculate()
+        
+        # STEP 7: Save as PDF if requested
+        if save_as_pdf:
+            try:
+                print(f"    Creating PDF for {row_data['customer_name']}...")
+                # Export to PDF using Excel's built-in PDF export
+                # Every option is given explicitly so Excel skips its slower defaults
+                template_wb.api.ExportAsFixedFormat(
+                    Type=0,                      # 0 = xlTypePDF
+                    Filename=str(pdf_output_file),
+                    Quality=0,                   # 0 = xlQualityStandard
+                    IncludeDocProperties=False,
+                    IgnorePrintAreas=False,      # Keep the template's print area
+                    OpenAfterPublish=False       # Never open the PDF viewer
+                )
+                pdf_created_successfully = True
+                print(f"    ✓ Successfully created PDF for '{row_data['customer_name']}'")
+            except Exception as e:
+                error = e
+                print(f"    ✗ Error creating PDF for row {row_number}: {e}")
+                pdf_created_successfully = False
+        
+        # STEP 8: Save as Excel if requested, if PDFs are turned off, or if PDF creation failed
+        # SaveCopyAs writes the filled-in template to a new file and leaves the open template as it is
+        if keep_excel or not pdf_created_successfully:
+            try:
+                if keep_excel or not save_as_pdf:
                     print(f"    Saving Excel version for {row_data['customer_name']}...")
-                    wb.save_as(excel_output_file)
-                else:
+                template_wb.api.SaveCopyAs(str(excel_output_file))
+                excel_created_successfully = True
+                if save_as_pdf and not pdf_created_successfully:
                     # PDF creation failed, so save as Excel as fallback
-                    wb.save()
                     print(f"    PDF creation failed for row {row_number}, saved as Excel instead")
-            
-            # STEP 12: Close the workbook to free up memory
-            wb.close()
+            except Exception as e:
+                error = e
+                if pdf_created_successfully:
+                    # The PDF is already on disk, so the row still counts as created
+                    print(f"    ⚠ PDF created but the Excel version could not be saved for row {row_number}: {e}")
+                else:
+                    print(f"    ✗ Error saving Excel version for row {row_number}: {e}")
     
     except Exception as e:
+        error = e
         print(f"    ✗ Error processing row {row_number}: {e}")
-        pdf_created_successfully = False
     
-    # STEP 13: Add temporary file to cleanup list (will be deleted later)
-    if temp_files_list is not None and save_as_pdf and pdf_created_successfully and not keep_excel:
-        temp_files_list.append(temp_excel_file)
+    # STEP 9: Return the path to the created file
+    if save_as_pdf and pdf_created_successfully:
+        return pdf_output_file
+    if excel_created_successfully:
+        return excel_output_file
+    # Nothing could be written - pass on the real reason so it shows in the final summary
+    raise RuntimeError(f"No declaration file could be created for row {row_number}: {error}") from error
+
+# Each worker process keeps its own Excel application and template workbook here,
+# set up once by init_excel_worker and reused for every row it processes
+worker_excel = {'app': None, 'template_wb': None}
+
+def init_excel_worker(template_file):
+    """
+    Set up a worker process with its own hidden Excel instance.
+    
+    This runs once when each worker process starts. It starts Excel, opens the
+    template and stores both in worker_excel so every row handled by this
+    worker reuses them. Excel is closed again when the worker process exits.
     
-    # STEP 14: Return the path to the created file
-    return pdf_output_file if (save_as_pdf and pdf_created_successfully) else excel_output_file
+    Excel's pop-ups, screen redraws, event macros and automatic recalculation
+    are all switched off for the life of the worker. Otherwise every cell
+    written to the template would trigger a recalculation and a redraw. The
+    template's page setup is also pinned once here, before any exports.
+    
+    Parameters:
+    - template_file (str): Path to declaration template file
+    """
+    import pythoncom
+    
+    # Each process needs COM set up before it can talk to Excel
+    pythoncom.CoInitialize()
+    
+    app = xw.App(visible=False, add_book=False)
+    worker_excel['app'] = app
+    # Register the clean-up straight away so Excel is closed even if the set-up below fails
+    atexit.register(close_excel_worker)
+    
+    # Speed up Excel by turning off pop-ups, screen redraws and event macros
+    app.display_alerts = False
+    app.screen_updating = False
+    app.enable_events = False
+    
+    # Open the template once - every row is filled in and exported from this workbook.
+    # It is never saved (only exported or copied with SaveCopyAs), so open it read-only:
+    # several workers open the same file at once and must all behave the same way.
+    template_wb = app.books.open(template_file, read_only=True)
+    worker_excel['template_wb'] = template_wb
+    # Turn off auto-recalculation (needs a workbook open to be set)
+    app.calculation = 'manual'
+    app.api.CalculateBeforeSave = False
+    
+    # Pin the page layout once so each PDF export reuses it. Keep the template's own
+    # print area if it has one. Page setup changes made while print communication is
+    # off are only applied when it is switched back on, so do that straight away,
+    # before any exports run.
+    app.api.PrintCommunication = False
+    try:
+        template_ws = template_wb.sheets.active
+        if not template_ws.api.PageSetup.PrintArea:
+            template_ws.api.PageSetup.PrintArea = template_ws.used_range.address
+    finally:
+        app.api.PrintCommunication = True
+
+def close_excel_worker():
+    """
+    Restore Excel's settings, close the template and quit the Excel instance
+    owned by this worker process.
+    """
+    app = worker_excel['app']
+    if app is None:
+        return
+    try:
+        # Put Excel back to normal before quitting (calculation needs a workbook open)
+        if worker_excel['template_wb'] is not None:
+            app.calculation = 'automatic'
+        app.enable_events = True
+        app.screen_updating = True
+    except Exception:
+        pass
+    finally:
+        try:
+            if worker_excel['template_wb'] is not None:
+                worker_excel['template_wb'].close()
+        except Exception:
+            pass
+        app.quit()
+        worker_excel['app'] = None
+        worker_excel['template_wb'] = None
+
+def create_declaration_in_worker(row_data, row_number, output_folder, save_as_pdf=True, keep_excel=False):
+    """
+    Create a declaration for one row using this worker process's Excel instance.
+    
+    The progress messages printed while the row is processed are collected in
+    memory and sent back with the result, so the main process can print each
+    row's messages in one write instead of one console write per message (and
+    rows from different workers don't get mixed together). If something goes
+    wrong the error is sent back together with the messages leading up to it,
+    rather than being raised, so they are printed together as well.
+    
+    Parameters:
+    - row_data (dict): Customer data for this row, as returned by extract_row_data
+    - row_number (int): Row number to process
+    - output_folder (Path): Where to save the generated files
+    - save_as_pdf (bool): Whether to save as PDF (default: True)
+    - keep_excel (bool): Whether to keep Excel version (default: False)
+    
+    Returns:
+    - tuple: (path to the created file or None, progress messages, error message or None)
+    """
+    messages = io.StringIO()
+    try:
+        with redirect_stdout(messages):
+            output_file = create_declaration_for_row(
+                row_data, worker_excel['template_wb'], row_number,
+                output_folder, save_as_pdf, keep_excel
+            )
+    except Exception as e:
+        # Send the error back with the messages leading up to it
+        return None, messages.getvalue(), str(e)
+    return output_file, messages.getvalue(), None
+
+def create_declarations_with_excel(rows_to_process, template_file, output_folder, save_as_pdf=True, keep_excel=False, max_workers=4):
+    """
+    Create all declarations using a pool of hidden Excel instances.
+    
+    Rows are independent, so they are handed out to up to max_workers worker
+    processes, each with its own Excel instance and open template.
+    
+    Parameters:
+    - rows_to_process (list): List of (row number, customer data) pairs
+    - template_file (str): Path to declaration template file
+    - output_folder (Path): Where to save generated files
+    - save_as_pdf (bool): Whether to save as PDF (default: True)
+    - keep_excel (bool): Whether to keep Excel versions (default: False)
+    - max_workers (int): Number of Excel instances to run in parallel (default: 4)
+    
+    Returns:
+    - tuple: (list of created files, list of (row number, error message) pairs)
+    """
+    created_files = []           # List of successfully created files
+    error_files = []             # List of errors that occurred
+    
+    # Rows are independent, so hand them out to a small pool of Excel workers.
+    # More than a handful of Excel instances just compete for the disk and COM.
+    num_workers = max(1, min(max_workers, len(rows_to_process)))
+    print(f"Using {num_workers} Excel worker(s)...")
+    
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=init_excel_worker, initargs=(template_file,)) as executor:
+        futures = {
+            executor.submit(create_declaration_in_worker, row_data, row_num, output_folder, save_as_pdf, keep_excel): row_num
+            for row_num, row_data in rows_to_process
+        }
+        
+        for i, future in enumerate(as_completed(futures), 1):
+            row_num = futures[future]
+            # Collect this row's messages and print them in a single write
+            messages = [f"\nFinished customer {i} of {len(rows_to_process)}:"]
+            try:
+                output_file, row_messages, error = future.result()
+            except Exception as e:
+                # The worker itself failed (e.g. Excel could not be started)
+                output_file, row_messages, error = None, "", str(e)
+            
+            if row_messages:
+                messages.append(row_messages.rstrip("\n"))
+            if error is None:
+                created_files.append(output_file)
+                messages.append(f"  ✓ Successfully processed row {row_num}")
+            else:
+                messages.append(f"  ✗ Error processing row {row_num}: {error}")
+                error_files.append((row_num, error))
+            
+            sys.stdout.write("\n".join(messages) + "\n")
+    
+    return created_files, error_files
+
+def create_declarations_with_libreoffice(rows_to_process, template_file, output_folder, save_as_pdf=True, keep_excel=False, soffice_path='soffice'):
+    """
+    Create all declarations without Excel, using openpyxl and LibreOffice.
+    
+    The template is loaded once with openpyxl and filled in for each row in
+    pure Python, then every filled-in file is converted to PDF by a single
+    headless LibreOffice run. This avoids Excel entirely, but it is only
+    suitable if the template survives being saved by openpyxl (openpyxl does
+    not keep images or charts) and LibreOffice's PDF layout is acceptable.
+    Formulas are recalculated by LibreOffice rather than Excel.
+    
+    Parameters:
+    - rows_to_process (list): List of (row number, customer data) pairs
+    - template_file (str): Path to declaration template file
+    - output_folder (Path): Where to save generated files
+    - save_as_pdf (bool): Whether to save as PDF (default: True)
+    - keep_excel (bool): Whether to keep Excel versions (default: False)
+    - soffice_path (str): Path to the LibreOffice 'soffice' program (default: 'soffice')
+    
+    Returns:
+    - tuple: (list of created files, list of (row number, error message) pairs)
+    """
+    created_files = []           # List of successfully created files
+    error_files = []             # List of errors that occurred
+    
+    # Load the template once - keep_vba keeps the macros in the .xlsm
+    print("Filling templates with openpyxl (Excel is not used)...")
+    template_wb = load_workbook(template_file, keep_vba=True)
+    ws = template_wb.active  # Use the active (first) sheet
+    
+    with tempfile.TemporaryDirectory() as temp_folder:
+        files_to_convert = []   # List of (row number, filled-in file, PDF file)
+        
+        for row_num, row_data in rows_to_process:
+            try:
+                pdf_output_file, excel_output_file = build_output_paths(row_data, output_folder)
+                
+                # Every row writes the same cells, so each one overwrites the last
+                for cell_address, value in build_template_updates(row_data):
+                    ws[cell_address] = value
+                
+                # Keep the Excel version in the output folder if wanted, otherwise
+                # save it to a temporary folder that is deleted when we're done
+                if keep_excel or not save_as_pdf:
+                    filled_file = excel_output_file
+                else:
+                    filled_file = Path(temp_folder) / excel_output_file.name
+                template_wb.save(filled_file)
+                files_to_convert.append((row_num, filled_file, pdf_output_file))
+                print(f"  ✓ Filled template for row {row_num}: {row_data['customer_name']}")
+            except Exception as e:
+                print(f"  ✗ Error processing row {row_num}: {e}")
+                error_files.append((row_num, str(e)))
+        
+        if not save_as_pdf:
+            created_files = [filled_file for _, filled_file, _ in files_to_convert]
+            return created_files, error_files
+        
+        if not files_to_convert:
+            return created_files, error_files
+        
+        # Remove old PDFs first so a failed conversion isn't mistaken for a new file.
+        # An old PDF that is still open (e.g. in a PDF viewer) can't be replaced,
+        # so that row is reported as an error and left out of the conversion.
+        convertible_files = []
+        for row_num, filled_file, pdf_output_file in files_to_convert:
+            try:
+                pdf_output_file.unlink(missing_ok=True)
+                convertible_files.append((row_num, filled_file, pdf_output_file))
+            except OSError as e:
+                print(f"  ✗ Row {row_num}: could not replace the existing PDF: {e}")
+                error_files.append((row_num, f"Could not replace the existing PDF: {e}"))
+        files_to_convert = convertible_files
+        
+        if not files_to_convert:
+            return created_files, error_files
+        
+        # Convert every file in one LibreOffice run so it only has to start up once.
+        # The PDFs take the file names of the filled-in files, which match the final names.
+        print(f"Converting {len(files_to_convert)} files to PDF with LibreOffice...")
+        conversion_error = "LibreOffice did not create the PDF"
+        try:
+            result = subprocess.run(
+                [soffice_path, '--headless', '--convert-to', 'pdf', '--outdir', output_folder,
+                 *[filled_file for _, filled_file, _ in files_to_convert]],
+                capture_output=True, text=True
+            )
+            if result.stderr.strip():
+                conversion_error = f"LibreOffice did not create the PDF: {result.stderr.strip()}"
+            if result.returncode != 0:
+                print(f"  ✗ LibreOffice PDF conversion failed (exit code {result.returncode})")
+        except OSError as e:
+            print(f"  ✗ LibreOffice PDF conversion failed: {e}")
+            conversion_error = f"LibreOffice did not create the PDF: {e}"
+        
+        for row_num, filled_file, pdf_output_file in files_to_convert:
+            if pdf_output_file.exists():
+                created_files.append(pdf_output_file)
+            else:
+                error_files.append((row_num, conversion_error))
+    
+    return created_files, error_files
 
 # =====================================================================================
 # SECTION 4: MAIN PROCESSING FUNCTION
 # =====================================================================================
 
-def process_all_supply_blend_rows(source_file, template_file, output_folder, save_as_pdf=True, keep_excel=False):
+def process_all_supply_blend_rows(source_file, template_file, output_folder, save_as_pdf=True, keep_excel=False, max_workers=4, pdf_engine='excel', soffice_path='soffice'):
     """
     Main processing function that handles all qualifying rows.
     
@@ -290,7 +763,14 @@ def process_all_supply_blend_rows(source_file, template_file, output_folder, sav
     1. Scans the source Excel file for rows with FF blend > 1%
     2. Processes each qualifying row to create a declaration
     3. Provides progress updates and error reporting
-    4. Cleans up temporary files at the end
+    
+    The source file is only read, so it is scanned with openpyxl in read-only
+    mode without starting Excel at all. A single hidden Excel instance is then
+    started in each of up to max_workers worker processes for the template
+    filling and PDF export, so several declarations are created at the same
+    time and Excel is not started again for every row. Alternatively, with
+    pdf_engine='libreoffice', the template is filled with openpyxl and
+    converted by LibreOffice without using Excel at all.
     
     Parameters:
     - source_file (str): Path to Excel file with customer data
@@ -298,6 +778,9 @@ def process_all_supply_blend_rows(source_file, template_file, output_folder, sav
     - output_folder (str): Where to save generated files
     - save_as_pdf (bool): Whether to save as PDF (default: True)
     - keep_excel (bool): Whether to keep Excel versions (default: False)
+    - max_workers (int): Number of Excel instances to run in parallel (default: 4)
+    - pdf_engine (str): 'excel' (default) or 'libreoffice'
+    - soffice_path (str): Path to the LibreOffice 'soffice' program, used with pdf_engine='libreoffice'
     """
     print("=" * 80)
     print("STARTING RFD AUTOMATION PROCESS")
@@ -306,69 +789,93 @@ def process_all_supply_blend_rows(source_file, template_file, output_folder, sav
     # STEP 1: Open source file and scan for qualifying rows
     print("Step 1: Scanning source file for qualifying customers...")
     
-    with xw.App(visible=False) as app:
-        wb = xw.Book(source_file)
-        ws = wb.sheets['RFAS GHG Saving Calculation']
-        
-        # Find the last row with data
-        last_row = ws.range('A1').end('down').row
-        print(f"Found data in rows 2 to {last_row}")
-        print("Looking for customers with FF blend greater than 1%...")
-        
-        rows_to_process = []
-        
-        # STEP 2: Check each row for FF blend > 1%
-        for row_num in range(2, last_row + 1):  # Start from row 2 (skip header)
-            ff_blend_value = ws[f'E{row_num}'].value  # Column E contains FF blend percentage
-            customer_name = ws[f'A{row_num}'].value   # Column A contains customer name
-            
-            # Check if FF blend value exists and is a number
-            if ff_blend_value is not None:
-                try:
-                    ff_blend_float = float(ff_blend_value)
-                except ValueError:
-                    # Skip rows where FF blend is not a number
-                    continue
-                
-                # Check if FF blend >= 1% (0.01 as decimal) and customer name exists
-                if ff_blend_float >= 0.01 and customer_name:
-                    rows_to_process.append(row_num)
-                    print(f"  ✓ Row {row_num}: {customer_name}")
+    # Build every output path from this one Path object
+    out = Path(output_folder)
+    
+    # Open the source file in read-only mode - values only, no formulas and no Excel
+    source_wb = load_workbook(source_file, read_only=True, data_only=True)
+    ws = source_wb['RFAS GHG Saving Calculation']
+    
+    print("Looking for customers with FF blend greater than 1%...")
+    
+    data_rows = []
+    
+    # STEP 2: Read every data row into memory
+    # Stream columns A to W one row at a time, starting from row 2 (skip header)
+    for data_row in ws.iter_rows(min_row=2, max_col=23, values_only=True):
+        # Stop at the first empty cell in column A (end of the data)
+        if data_row[0] is None:
+            break
+        data_rows.append(data_row)
+    
+    source_wb.close()
+    last_row = len(data_rows) + 1
+    print(f"Found data in rows 2 to {last_row}")
+    
+    # One table with a column per Excel column (A to W), indexed by Excel row number
+    source_data = pd.DataFrame(
+        data_rows,
+        columns=[chr(ord('A') + i) for i in range(23)],
+        index=range(2, last_row + 1),
+        dtype=object  # Keep the values exactly as read, e.g. blanks stay as None
+    )
+    
+    # Check every row for FF blend >= 1% (0.01 as decimal) and a customer name in one go
+    # Column E contains FF blend percentage - anything that is not a number becomes NaN and fails
+    ff_blend = pd.to_numeric(source_data['E'], errors='coerce')
+    # Column A contains customer name
+    has_customer_name = source_data['A'].notna() & (source_data['A'].astype(str).str.len() > 0)
+    qualifying = source_data[(ff_blend >= 0.01) & has_customer_name]
+    
+    if not qualifying.empty:
+        print("\n".join(f"  ✓ Row {row_num}: {customer_name}" for row_num, customer_name in qualifying['A'].items()))
+    
+    # Put the qualifying customers into one table (indexed by Excel row number) so
+    # the file name fields can be cleaned a whole column at a time
+    customers = pd.DataFrame(
+        [extract_row_data(data_row) for data_row in qualifying.itertuples(index=False, name=None)],
+        index=qualifying.index,
+        dtype=object
+    )
+    invalid_rows = []
+    if not customers.empty:
+        # Check all the data now and drop bad rows before any files are created
+        customers, invalid_rows = validate_customers(customers)
+        for row_num, problem in invalid_rows:
+            print(f"  ✗ Row {row_num}: {problem}")
         
-        wb.close()
+        # The issue date is the same for every declaration, so work it out once
+        customers['date_dec_issued'] = datetime.now().strftime('%d/%m/%Y')  # Current date in UK format
+        customers['saveable_customer_name'] = sanitize_filenames(customers['customer_name'])
+        customers['saveable_certificate_number'] = sanitize_filenames(customers['certificate_number'])
+        customers['saveable_declaration_period'] = sanitize_filenames(customers['declaration_period'])
+    
+    rows_to_process = list(zip(customers.index, customers.to_dict('records')))
+    
+    # Rows that would produce the same file name as an earlier row are dropped here,
+    # before choosing the PDF engine, so neither engine overwrites a declaration
+    rows_to_process, duplicate_rows = remove_duplicate_output_rows(rows_to_process, out)
+    for row_num, problem in duplicate_rows:
+        print(f"  ✗ Row {row_num}: {problem}")
+    invalid_rows = sorted(invalid_rows + duplicate_rows)
     
     # STEP 3: Process each qualifying row
     print(f"\nStep 2: Processing {len(rows_to_process)} qualifying customers...")
     print("-" * 50)
     
-    created_files = []           # List of successfully created files
-    error_files = []             # List of errors that occurred
-    temp_files_to_cleanup = []   # List of temporary files to delete later
-    
-    for i, row_num in enumerate(rows_to_process, 1):
-        print(f"\nProcessing customer {i} of {len(rows_to_process)}:")
-        try:
-            # Create declaration for this row
-            output_file = create_declaration_for_row(
-                source_file, template_file, row_num, output_folder, 
-                save_as_pdf, keep_excel, temp_files_to_cleanup
-            )
-            
-            if output_file:
-                created_files.append(output_file)
-                print(f"  ✓ Successfully processed row {row_num}")
-            else:
-                print(f"  - Skipped row {row_num} (no customer name)")
-                
-        except Exception as e:
-            print(f"  ✗ Error processing row {row_num}: {e}")
-            error_files.append((row_num, str(e)))
+    if pdf_engine == 'libreoffice':
+        created_files, error_files = create_declarations_with_libreoffice(
+            rows_to_process, template_file, out, save_as_pdf, keep_excel, soffice_path
+        )
+    else:
+        created_files, error_files = create_declarations_with_excel(
+            rows_to_process, template_file, out, save_as_pdf, keep_excel, max_workers
+        )
     
-    # STEP 4: Clean up temporary files
-    print(f"\nStep 3: Cleaning up temporary files...")
-    cleanup_temp_files(temp_files_to_cleanup)
+    # Rows that failed the up-front checks are reported alongside any other errors
+    error_files = invalid_rows + error_files
     
-    # STEP 5: Display final results
+    # STEP 4: Display final results
     print("\n" + "=" * 80)
     print("PROCESS COMPLETED!")
     print("=" * 80)
@@ -377,7 +884,7 @@ def process_all_supply_blend_rows(source_file, template_file, output_folder, sav
     print(f"Successfully created {len(created_files)} {file_type} declaration files:")
     
     for file in created_files:
-        print(f"  ✓ {os.path.basename(file)}")
+        print(f"  ✓ {file.name}")
     
     if error_files:
         print(f"\nErrors occurred with {len(error_files)} rows:")
@@ -389,44 +896,7 @@ def process_all_supply_blend_rows(source_file, template_file, output_folder, sav
     print(f"\nAll files saved to: {output_folder}")
 
 # =====================================================================================
-# SECTION 5: UTILITY FUNCTIONS
-# =====================================================================================
-
-def cleanup_temp_files(temp_files_list):
-    """
-    Clean up temporary Excel files created during processing.
-    
-    This function attempts to delete temporary files multiple times with delays,
-    as Excel files can sometimes be locked by Windows.
-    
-    Parameters:
-    - temp_files_list (list): List of temporary file paths to delete
-    """
-    import time
-    
-    if not temp_files_list:
-        print("  No temporary files to clean up")
-        return
-    
-    print(f"  Attempting to delete {len(temp_files_list)} temporary files...")
-    
-    for temp_file in temp_files_list:
-        # Try up to 5 times to delete each file (in case of file locking)
-        for attempt in range(5):
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                    print(f"    ✓ Deleted: {os.path.basename(temp_file)}")
-                break  # Successfully deleted, move to next file
-            except Exception as e:
-                print(f"    Attempt {attempt+1} failed for {temp_file}: {e}")
-                time.sleep(1)  # Wait 1 second before retrying
-        else:
-            # If we get here, all 5 attempts failed
-            print(f"    ✗ Could not delete after 5 attempts: {temp_file}")
-
-# =====================================================================================
-# SECTION 6: CONFIGURATION AND MAIN EXECUTION
+# SECTION 5: CONFIGURATION AND MAIN EXECUTION
 # =====================================================================================
 
 def main():
@@ -469,6 +939,19 @@ def main():
     # keep_excel=True: Keeps both PDF and Excel files
     keep_excel = False
     
+    # max_workers: How many copies of Excel to run at the same time
+    # 4 is a good default - more than this usually slows things down
+    max_workers = 4
+    
+    # pdf_engine='excel': Uses Excel to fill the template and create the PDFs (recommended)
+    # pdf_engine='libreoffice': Fills the template without Excel and converts with LibreOffice
+    #   (faster, but images/charts in the template are lost and the layout may differ)
+    pdf_engine = 'excel'
+    
+    # Path to LibreOffice, only used when pdf_engine='libreoffice'
+    # UPDATE THIS if 'soffice' is not on your PATH
+    soffice_path = r"C:\Program Files\LibreOffice\program\soffice.exe"
+    
     # ==================================================================================
     # VALIDATION AND SETUP
     # ==================================================================================
@@ -499,7 +982,10 @@ def main():
         template_file=template_file,
         output_folder=output_folder,
         save_as_pdf=save_as_pdf,
-        keep_excel=keep_excel
+        keep_excel=keep_excel,
+        max_workers=max_workers,
+        pdf_engine=pdf_engine,
+        soffice_path=soffice_path
     )
     
     print("\nAutomation process completed!")